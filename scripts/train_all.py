@@ -6,27 +6,38 @@ Runs the full Sprint 1 pipeline in order:
 2) Generate data quality report
 3) Train LightGBM baseline + save artifacts
 
+The steps run in one process: the loader's DataFrame is handed straight to
+the quality report and the trainer, so the processed parquet is written once
+and never re-read, and Python/pandas/lightgbm are imported once instead of
+once per subprocess.
+
 Usage:
   python scripts/train_all.py
 """
 
-import subprocess
 import sys
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
 
-def run(cmd: list[str]) -> None:
-    print(f"\n==> Running: {' '.join(cmd)}")
-    subprocess.run(cmd, check=True)
+import data_quality
+import train_lgbm
+from credit_decisioning.data import load_lendingclub
 
 
 def main() -> int:
     try:
-        run([sys.executable, "src/credit_decisioning/data/load_lendingclub.py"])
-        run([sys.executable, "scripts/data_quality.py"])
-        run([sys.executable, "scripts/train_lgbm.py"])
-    except subprocess.CalledProcessError as e:
-        print(f"\nERROR: Step failed with exit code {e.returncode}")
-        return e.returncode
+        print("\n==> Running: load_lendingclub")
+        df = load_lendingclub.main()
+
+        print("\n==> Running: data_quality")
+        data_quality.main(df=df)
+
+        print("\n==> Running: train_lgbm")
+        train_lgbm.main(df=df)
+    except Exception as e:
+        print(f"\nERROR: Step failed: {e}")
+        return 1
 
     print("\nDONE: Sprint 1 pipeline completed successfully.")
     return 0
@@ -5,14 +5,17 @@ What this does (high level):
 - Reads the processed dataset (data/processed/train.parquet)
 - Builds a simple baseline preprocessing:
   - numeric features are kept as-is
-  - categorical features are one-hot encoded (pd.get_dummies)
+  - categorical features are passed as pandas `category` dtype and handled
+    natively by LightGBM (no one-hot blowup)
 - Splits the data into train/validation (stratified)
 - Trains a LightGBM classifier
 - Evaluates with AUC and Brier score
 - Saves artifacts for later use (API, monitoring, etc.)
 
 Artifacts:
-- artifacts/models/lgbm_model.joblib  (model + feature list)
+- artifacts/models/lgbm_model.txt     (native LightGBM booster, fast C-side load)
+- artifacts/models/lgbm_model_meta.json  (feature lists / categorical levels)
+- artifacts/models/lgbm_model.joblib  (sklearn wrapper bundle, kept for notebooks)
 - artifacts/models/lgbm_model_info.json
 - artifacts/reports/metrics.json
 """
@@ -25,33 +28,22 @@ import pandas as pd
 from lightgbm import LGBMClassifier
 from sklearn.metrics import brier_score_loss, roc_auc_score
 from sklearn.model_selection import train_test_split
-import re
 
 
-def sanitize_feature_names(columns: list[str]) -> list[str]:
-    """
-    LightGBM does not allow some special JSON characters in feature names.
-    We replace any non-alphanumeric or underscore characters with underscore.
-    """
-    cleaned = []
-    for c in columns:
-        c2 = re.sub(r"[^0-9a-zA-Z_]+", "_", str(c))
-        cleaned.append(c2)
-    return cleaned
-
-
-def main() -> None:
+def main(df: pd.DataFrame | None = None) -> dict:
     # ---- Paths (project conventions) ----
     data_path = Path("data/processed/train.parquet")
     model_path = Path("artifacts/models/lgbm_model.joblib")
+    booster_path = Path("artifacts/models/lgbm_model.txt")
+    meta_path = Path("artifacts/models/lgbm_model_meta.json")
     info_path = Path("artifacts/models/lgbm_model_info.json")
     metrics_path = Path("artifacts/reports/metrics.json")
 
-    if not data_path.exists():
-        raise FileNotFoundError(f"Processed dataset not found: {data_path}")
-
-    # ---- Load data ----
-    df = pd.read_parquet(data_path)
+    # ---- Load data (skipped when the orchestrator passes the frame) ----
+    if df is None:
+        if not data_path.exists():
+            raise FileNotFoundError(f"Processed dataset not found: {data_path}")
+        df = pd.read_parquet(data_path)
 
     if "target" not in df.columns:
         raise ValueError("Missing required column: target")
@@ -60,11 +52,10 @@ def main() -> None:
     X = df.drop(columns=["target", "issue_d", "issue_month"])
 
     # ---- Baseline preprocessing ----
-    # One-hot encoding is a simple, transparent baseline.
-    # Later (Sprint 2+) we can switch to LightGBM native categorical handling or better encodings.
-    X = pd.get_dummies(X, dummy_na=True)
-    X.columns = sanitize_feature_names(list(X.columns))
-    X = X.loc[:, ~X.columns.duplicated()]  # in case cleaning creates duplicates
+    # Categorical columns stay as `category` dtype; LightGBM consumes them
+    # directly and finds splits on raw categories. This avoids materializing
+    # the wide one-hot matrix (hundreds of columns for sub_grade/addr_state).
+    cat_cols = X.select_dtypes("category").columns.tolist()
 
     # ---- Train/Validation split ----
     X_train, X_val, y_train, y_val = train_test_split(
@@ -87,7 +78,7 @@ def main() -> None:
         n_jobs=-1,
     )
 
-    model.fit(X_train, y_train)
+    model.fit(X_train, y_train, categorical_feature=cat_cols)
 
     # ---- Evaluate ----
     val_proba = model.predict_proba(X_val)[:, 1]
@@ -98,8 +89,21 @@ def main() -> None:
     model_path.parent.mkdir(parents=True, exist_ok=True)
     metrics_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Store model + feature names (important for consistent scoring later)
-    joblib.dump({"model": model, "feature_names": list(X.columns)}, model_path)
+    # Store model + the full scoring contract: ordered feature names, the
+    # numeric columns, and each categorical column's levels. The API builds
+    # its feature vectors from these lists alone — no pandas alignment.
+    scoring_meta = {
+        "feature_names": list(X.columns),
+        "numeric_features": [col for col in X.columns if col not in cat_cols],
+        "categorical_features": {col: list(X[col].cat.categories) for col in cat_cols},
+    }
+    joblib.dump({"model": model, **scoring_meta}, model_path)
+
+    # Native booster + JSON sidecar: the API cold path parses these in native
+    # code / milliseconds, instead of unpickling the sklearn wrapper.
+    model.booster_.save_model(booster_path)
+    with meta_path.open("w", encoding="utf-8") as f:
+        json.dump(scoring_meta, f, indent=2)
 
     info = {
         "model_type": "lightgbm",
@@ -120,9 +124,11 @@ def main() -> None:
         json.dump(metrics, f, indent=2)
 
     print(f"Saved model -> {model_path}")
+    print(f"Saved booster -> {booster_path} (+ {meta_path})")
     print(f"Saved model info -> {info_path}")
     print(f"Saved metrics -> {metrics_path}")
     print(f"VAL AUC={auc:.4f} | Brier={brier:.4f}")
+    return metrics
 
 
 if __name__ == "__main__":
@@ -4,32 +4,139 @@ FastAPI app (Sprint 1)
 Endpoints:
 - GET /health
 - POST /score
+- POST /score_batch
 
-The /score endpoint loads the saved LightGBM artifact created by scripts/train_all.py
-and returns:
+The scoring endpoints load the saved LightGBM artifact created by
+scripts/train_all.py and return:
 - PD (probability of default)
 - simple decision policy (approve/review/reject)
 """
 
+import json
+from functools import lru_cache
 from pathlib import Path
+
 import joblib
-import pandas as pd
+import lightgbm as lgb
+import numpy as np
 from fastapi import FastAPI, HTTPException
 
-from credit_decisioning.app.schemas import ScoreRequest, ScoreResponse
+from credit_decisioning.app.schemas import (
+    ScoreBatchRequest,
+    ScoreBatchResponse,
+    ScoreRequest,
+    ScoreResponse,
+)
 
 app = FastAPI(title="Credit Decisioning Platform")
 
 MODEL_PATH = Path("artifacts/models/lgbm_model.joblib")
+BOOSTER_PATH = Path("artifacts/models/lgbm_model.txt")
+META_PATH = Path("artifacts/models/lgbm_model_meta.json")
 
 
+@lru_cache(maxsize=1)
 def load_model():
+    """
+    Load the booster + scoring metadata once per process.
+
+    Prefers the native LightGBM model file plus JSON sidecar (parsed in C /
+    milliseconds); falls back to the joblib bundle for artifacts trained
+    before the native format existed. Kept lazy so /health works (and /score
+    returns a clear error) when nothing has been trained yet.
+    """
+    if BOOSTER_PATH.exists() and META_PATH.exists():
+        booster = lgb.Booster(model_file=str(BOOSTER_PATH))
+        meta = json.loads(META_PATH.read_text(encoding="utf-8"))
+        return booster, meta["feature_names"], meta["categorical_features"]
+
     if not MODEL_PATH.exists():
         raise FileNotFoundError(
-            f"Model not found at {MODEL_PATH}. Run: python scripts/train_all.py"
+            f"Model not found at {BOOSTER_PATH} or {MODEL_PATH}. "
+            "Run: python scripts/train_all.py"
         )
     bundle = joblib.load(MODEL_PATH)
-    return bundle["model"], bundle["feature_names"]
+    categorical_features = bundle.get("categorical_features")
+    if categorical_features is None:
+        # Bundle predates the scoring contract (pre-native-categorical
+        # trainer); scoring against it would mis-encode every categorical.
+        raise RuntimeError(
+            f"Model bundle at {MODEL_PATH} has no categorical_features; "
+            "it was trained before the scoring contract existed. "
+            "Retrain: python scripts/train_all.py"
+        )
+    return bundle["model"].booster_, bundle["feature_names"], categorical_features
+
+
+@lru_cache(maxsize=1)
+def scoring_context():
+    """
+    Precompute everything the hot path needs: the raw Booster, the
+    column -> matrix-index mapping, and category -> code lookups matching
+    the training-time pandas categorical codes.
+    """
+    booster, feature_names, categorical_features = load_model()
+    feature_index = {col: j for j, col in enumerate(feature_names)}
+    category_codes = {
+        col: {value: float(code) for code, value in enumerate(categories)}
+        for col, categories in categorical_features.items()
+    }
+    return booster, feature_names, feature_index, category_codes
+
+
+def predict(booster, X: np.ndarray) -> np.ndarray:
+    """
+    One prediction call tuned for serving: pin num_iteration so LightGBM does
+    not re-resolve it per call, and keep inference single-threaded — request
+    concurrency comes from the server workers, and spinning up an OpenMP
+    pool per one-row predict costs more than it saves. The shape check is
+    skipped because build_matrix always emits exactly n_features columns.
+    """
+    return booster.predict(
+        X,
+        num_iteration=booster.best_iteration,
+        num_threads=1,
+        predict_disable_shape_check=True,
+    )
+
+
+def build_matrix(rows: list[dict]) -> np.ndarray:
+    """
+    Build the (n_rows, n_features) float matrix LightGBM predicts on.
+
+    Categorical values become their training-time codes, numerics are cast to
+    float; anything missing, unseen or unparseable becomes NaN, which
+    LightGBM treats as missing. No pandas in the request path.
+    """
+    _, feature_names, feature_index, category_codes = scoring_context()
+
+    X = np.full((len(rows), len(feature_names)), np.nan, dtype=np.float64)
+    for i, features in enumerate(rows):
+        for col, value in features.items():
+            j = feature_index.get(col)
+            if j is None or value is None:
+                continue
+            codes = category_codes.get(col)
+            if codes is not None:
+                X[i, j] = codes.get(value, np.nan)
+            else:
+                try:
+                    X[i, j] = float(value)
+                except (TypeError, ValueError):
+                    pass
+    return X
+
+
+def decide(proba: float) -> ScoreResponse:
+    # Simple baseline policy (Sprint 2 becomes segment/policy-aware)
+    if proba < 0.03:
+        decision = "approve"
+    elif proba < 0.08:
+        decision = "review"
+    else:
+        decision = "reject"
+
+    return ScoreResponse(pd=proba, decision=decision, reasons=["baseline_policy"])
 
 
 @app.get("/health")
@@ -40,30 +147,21 @@ def health():
 @app.post("/score", response_model=ScoreResponse)
 def score(req: ScoreRequest):
     try:
-        model, feature_names = load_model()
-    except FileNotFoundError as e:
+        booster, *_ = scoring_context()
+    except (FileNotFoundError, RuntimeError) as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    # Build one-row dataframe from incoming features
-    X = pd.DataFrame([req.features])
+    proba = float(predict(booster, build_matrix([req.features]))[0])
+    return decide(proba)
 
-    # One-hot encode similarly to training
-    X = pd.get_dummies(X, dummy_na=True)
 
-    # Align columns to training feature set (missing -> 0)
-    for col in feature_names:
-        if col not in X.columns:
-            X[col] = 0
-    X = X[feature_names]
-
-    proba = float(model.predict_proba(X)[0, 1])
-
-    # Simple baseline policy (Sprint 2 becomes segment/policy-aware)
-    if proba < 0.03:
-        decision = "approve"
-    elif proba < 0.08:
-        decision = "review"
-    else:
-        decision = "reject"
+@app.post("/score_batch", response_model=ScoreBatchResponse)
+def score_batch(req: ScoreBatchRequest):
+    """Score many applications in one LightGBM call."""
+    try:
+        booster, *_ = scoring_context()
+    except (FileNotFoundError, RuntimeError) as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-    return ScoreResponse(pd=proba, decision=decision, reasons=["baseline_policy"])
+    probas = predict(booster, build_matrix(req.rows))
+    return ScoreBatchResponse(results=[decide(float(p)) for p in probas])
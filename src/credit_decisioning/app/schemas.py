@@ -10,3 +10,11 @@ class ScoreResponse(BaseModel):
     pd: float
     decision: str
     reasons: List[str]
+
+
+class ScoreBatchRequest(BaseModel):
+    rows: List[Dict[str, Any]]
+
+
+class ScoreBatchResponse(BaseModel):
+    results: List[ScoreResponse]
@@ -0,0 +1,85 @@
+"""
+Feature encoding helpers (Sprint 1)
+
+The LightGBM baseline consumes `category` dtypes natively, but some models
+(e.g. a linear baseline) still need one-hot encoding. `pd.get_dummies` builds
+one boolean column at a time, which is slow and memory-hungry on
+wide-cardinality columns like sub_grade/addr_state. The helpers here build
+the whole one-hot block in a single vectorized pass from categorical codes
+and return a sparse CSR matrix, which LightGBM/sklearn estimators accept
+directly.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+def one_hot_encode(
+    df: pd.DataFrame, columns: list[str] | None = None
+) -> tuple[sparse.csr_matrix, list[str], dict[str, list]]:
+    """
+    One-hot encode categorical columns of df into a single sparse matrix.
+
+    Numeric columns are kept as-is (one sparse column each; NaN stays NaN).
+    Each categorical column contributes one indicator column per category
+    plus a `<col>_nan` indicator, mirroring pd.get_dummies(dummy_na=True).
+
+    Returns (X, feature_names, categories) where `categories` maps each
+    encoded column to its category list, for reuse at scoring time via
+    one_hot_transform.
+    """
+    if columns is None:
+        columns = df.select_dtypes(["category", "object", "string"]).columns.tolist()
+
+    categories = {col: list(pd.Categorical(df[col]).categories) for col in columns}
+    return one_hot_transform(df, categories), _feature_names(df, categories), categories
+
+
+def one_hot_transform(df: pd.DataFrame, categories: dict[str, list]) -> sparse.csr_matrix:
+    """
+    Encode df against a fixed category mapping (training-time `categories`).
+
+    Unseen values fall into the `<col>_nan` slot together with missing ones.
+    """
+    n_rows = len(df)
+    blocks = []
+
+    for col in df.columns:
+        if col not in categories:
+            # NaN is stored explicitly in the sparse data array — it means
+            # "missing", not zero; imputation is the consuming model's call.
+            values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float32)
+            blocks.append(sparse.csr_matrix(values.reshape(-1, 1)))
+            continue
+
+        cats = categories[col]
+        codes = pd.Index(cats).get_indexer(df[col])
+        # One indicator per category + trailing NaN/unseen indicator.
+        # Single vectorized construction: row i sets column `codes[i]`
+        # (or the NaN slot for code -1) — no per-category passes.
+        codes = np.where(codes < 0, len(cats), codes)
+        block = sparse.csr_matrix(
+            (
+                np.ones(n_rows, dtype=np.int8),
+                codes,
+                np.arange(n_rows + 1),
+            ),
+            shape=(n_rows, len(cats) + 1),
+        )
+        blocks.append(block)
+
+    return sparse.hstack(blocks, format="csr")
+
+
+def _feature_names(df: pd.DataFrame, categories: dict[str, list]) -> list[str]:
+    names: list[str] = []
+    for col in df.columns:
+        if col in categories:
+            names.extend(f"{col}_{cat}" for cat in categories[col])
+            names.append(f"{col}_nan")
+        else:
+            names.append(col)
+    return names
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from credit_decisioning.features import one_hot_encode, one_hot_transform
+
+
+def test_one_hot_encode_matches_get_dummies_layout():
+    df = pd.DataFrame(
+        {
+            "amount": [100.0, np.nan, 300.0],
+            "grade": pd.Categorical(["A", "B", None], categories=["A", "B", "C"]),
+        }
+    )
+
+    X, feature_names, categories = one_hot_encode(df)
+
+    assert feature_names == ["amount", "grade_A", "grade_B", "grade_C", "grade_nan"]
+    assert categories == {"grade": ["A", "B", "C"]}
+
+    dense = X.toarray()
+    assert dense.shape == (3, 5)
+    # numeric NaN must survive encoding (missing income != zero income)
+    np.testing.assert_array_equal(dense[:, 0], [100.0, np.nan, 300.0])
+    np.testing.assert_array_equal(dense[:, 1:], [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+
+
+def test_one_hot_transform_maps_unseen_to_nan_slot():
+    categories = {"grade": ["A", "B"]}
+    df = pd.DataFrame({"grade": ["B", "ZZZ"]})
+
+    dense = one_hot_transform(df, categories).toarray()
+
+    np.testing.assert_array_equal(dense, [[0, 1, 0], [0, 0, 1]])
@@ -11,3 +11,12 @@ def test_model_artifact_exists_and_has_expected_keys():
     assert "feature_names" in bundle
     assert isinstance(bundle["feature_names"], list)
     assert len(bundle["feature_names"]) > 0
+
+    # Scoring contract: every feature is either numeric or categorical,
+    # in training column order, so the API can build vectors without pandas
+    assert "numeric_features" in bundle
+    assert "categorical_features" in bundle
+    assert isinstance(bundle["categorical_features"], dict)
+    assert set(bundle["feature_names"]) == set(bundle["numeric_features"]) | set(
+        bundle["categorical_features"]
+    )